@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Manual test client for a ToolHive-proxied MCP server.
+
+Exercises the SSE endpoint both over a raw socket (to see the exact
+bytes on the wire) and through the requests library.
+
+Usage: test-mcp-client.py [port]
+"""
+
+import json
+import re
+import socket
+import sys
+
+import requests
+import sseclient
+from requests.adapters import HTTPAdapter
+
+HOST = "localhost"
+PORT = int(sys.argv[1]) if len(sys.argv) > 1 else 9090
+BASE_URL = f"http://{HOST}:{PORT}"
+SSE_URL = f"{BASE_URL}/sse"
+
+# One session for the whole run: HTTP/1.1 keep-alive reuses the TCP
+# connection across the JSON-RPC calls instead of paying a fresh
+# handshake per request.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+CONTENT_LENGTH_RE = re.compile(rb"(?i)content-length:\s*(\d+)")
+
+RECV_CHUNK = 65536
+
+
+def recv_http_response(sock):
+    """Read one HTTP response, using Content-Length to stop promptly.
+
+    Without this the recv loop always sits out the full socket timeout
+    after the last byte arrives. If the response carries no
+    Content-Length (e.g. an SSE stream), the timeout remains the
+    backstop.
+
+    Receives into a preallocated buffer in 64 KB chunks: appending
+    4 KB recv() results to a bytes object is quadratic in the response
+    size and makes 16x as many syscalls.
+    """
+    buf = bytearray(1 << 20)
+    view = memoryview(buf)
+    off = 0
+
+    def recv_chunk():
+        nonlocal buf, view, off
+        if len(buf) - off < RECV_CHUNK:
+            view.release()  # a bytearray can't grow while a view exports it
+            buf += bytes(len(buf))
+            view = memoryview(buf)
+        try:
+            n = sock.recv_into(view[off:off + RECV_CHUNK])
+        except socket.timeout:
+            return 0
+        off += n
+        return n
+
+    header_end = -1
+    while header_end < 0:
+        if not recv_chunk():
+            return bytes(view[:off])
+        header_end = buf.find(b"\r\n\r\n", 0, off)
+
+    match = CONTENT_LENGTH_RE.search(buf[:header_end])
+    if match is None:
+        # No Content-Length: read until the peer closes (or we time out).
+        while recv_chunk():
+            pass
+        return bytes(view[:off])
+
+    total = header_end + 4 + int(match.group(1))
+    while off < total:
+        if not recv_chunk():
+            break
+    return bytes(view[:off])
+
+
+def send_jsonrpc_request(method, params=None, request_id=1):
+    """Send a JSON-RPC request to the MCP server and print the reply."""
+    request = {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": method,
+    }
+    if params is not None:
+        request["params"] = params
+
+    # Serialize once and post the bytes directly; passing json=request
+    # would make requests run json.dumps a second time internally.
+    body = json.dumps(request).encode("utf-8")
+    print(f"Sending request: {body.decode()}")
+    try:
+        response = SESSION.post(
+            SSE_URL,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            timeout=5,
+        )
+        print(f"Response status: {response.status_code}")
+        print(f"Response body: {response.text}")
+    except requests.RequestException as exc:
+        print(f"Request failed: {exc}")
+
+
+def main():
+    # Confirm the SSE stream is alive by reading a single event with a
+    # bounded timeout, rather than holding a raw socket open until its
+    # timeout expires.
+    print("Checking the SSE stream:")
+    try:
+        stream = SESSION.get(
+            SSE_URL, stream=True, headers={"Accept": "text/event-stream"}, timeout=5
+        )
+        client = sseclient.SSEClient(stream)
+        event = next(client.events(), None)
+        if event is not None:
+            print(f"First SSE event: {event.event}: {event.data}")
+        else:
+            print("SSE stream closed without an event")
+        stream.close()
+    except requests.RequestException as exc:
+        print(f"SSE check failed: {exc}")
+
+    # Post a JSON-RPC message over a direct socket connection so we can
+    # inspect the raw HTTP exchange.
+    print("Posting a JSON-RPC message over a direct socket connection:")
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # Disable Nagle's algorithm: these are tiny latency-bound requests,
+    # and Nagle plus the peer's delayed ACK can stall each one by ~40ms.
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.settimeout(5)
+    try:
+        sock.connect((HOST, PORT))
+        body = json.dumps({"jsonrpc": "2.0", "id": 0, "method": "ping"}).encode("ascii")
+        header = (
+            "POST /sse HTTP/1.1\r\n"
+            f"Host: {HOST}:{PORT}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        ).encode("ascii")
+        # Single sendall so headers and body leave in one write; with
+        # TCP_NODELAY set above, that write goes out immediately.
+        sock.sendall(header + body)
+        print(recv_http_response(sock).decode(errors="replace"))
+    finally:
+        sock.close()
+
+    # Now drive the normal MCP handshake through requests.
+    print("Using the requests library:")
+    send_jsonrpc_request(
+        "initialize",
+        {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "test-mcp-client", "version": "0.1.0"},
+        },
+        request_id=1,
+    )
+    send_jsonrpc_request("notifications/initialized", request_id=2)
+    send_jsonrpc_request("tools/list", request_id=3)
+    send_jsonrpc_request("ping", request_id=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Tiny OAuth-protected HTTP server for testing ToolHive's auth flow.
+
+Responds 401 with a WWW-Authenticate challenge until the client
+presents the expected bearer token, then 200. Useful for pointing thv
+at a remote server that requires authentication.
+
+Usage: test_oauth_server.py [port]
+"""
+
+import json
+import socket
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+EXPECTED_TOKEN = "test-token"
+
+# The two responses never change, so serialize them once instead of
+# running json.dumps on every request. Content-Length lets clients
+# stop reading as soon as the body is complete.
+AUTH_OK = json.dumps(
+    {"status": "authenticated", "message": "Access granted with token"}
+).encode()
+AUTH_OK_LEN = str(len(AUTH_OK))
+AUTH_FAIL = json.dumps(
+    {"error": "unauthorized", "message": "Authentication required"}
+).encode()
+AUTH_FAIL_LEN = str(len(AUTH_FAIL))
+
+
+class OAuthTestHandler(BaseHTTPRequestHandler):
+    """Serve 200 with the expected bearer token, 401 otherwise."""
+
+    def do_GET(self):
+        auth = self.headers.get("Authorization", "")
+        if auth == f"Bearer {EXPECTED_TOKEN}":
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", AUTH_OK_LEN)
+            self.end_headers()
+            self.wfile.write(AUTH_OK)
+        else:
+            self.send_response(401)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", AUTH_FAIL_LEN)
+            self.send_header("WWW-Authenticate", 'Bearer realm="toolhive-test"')
+            self.end_headers()
+            self.wfile.write(AUTH_FAIL)
+
+
+class NoDelayHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server that disables Nagle's on accepted sockets.
+
+    ThreadingHTTPServer handles each connection on its own thread, so a
+    slow or retrying client can't head-of-line block the OAuth probes
+    ToolHive issues in parallel.
+
+    The responses here are tiny and fully buffered before being written,
+    so Nagle buys nothing; with it on, the small writes plus the
+    client's delayed ACK can push tail latency to ~40ms per exchange.
+    """
+
+    def process_request(self, request, client_address):
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().process_request(request, client_address)
+
+
+def run_server(port=8080):
+    server_address = ("", port)
+    httpd = NoDelayHTTPServer(server_address, OAuthTestHandler)
+    httpd.daemon_threads = True  # let Ctrl-C exit promptly
+    print(f"Serving OAuth test server on port {port}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        httpd.server_close()
+
+
+if __name__ == "__main__":
+    run_server(int(sys.argv[1]) if len(sys.argv) > 1 else 8080)